@@ -1,12 +1,21 @@
 import numpy as np
-import matplotlib
-matplotlib.use("TkAgg")
+#The GUI backend is no longer forced to TkAgg: call matplotlib.use(...) before
+#importing this module to pick one (QtAgg renders this artist mix faster)
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button
-import networkx as nx 
+from matplotlib.collections import LineCollection
+import networkx as nx
+import collections
+try:
+    from scipy.spatial import cKDTree #Optional: O(log N) node pickup on large graphs
+except ImportError:
+    cKDTree = None
+try:
+    from numba import njit, prange #Optional: compiles the batched multi-node update
+except ImportError:
+    njit = None
+    prange = range
 import threading
-import time 
-from tkinter import filedialog
 '''
 Author: Kuan-Lun Hsu 
 Purpose: Create an interactive interface for drawing a network
@@ -47,14 +56,69 @@ Reference5: https://matplotlib.org/stable/_modules/matplotlib/text.html#Text
 Reference6: https://matplotlib.org/stable/users/event_handling.html
 '''
 
+position_filetypes = [('NumPy archive', '*.npz'), ('Text file', '*.txt')]
+
+def default_save_dialog():
+    #tkinter is imported lazily so users on a Qt backend never initialize Tk
+    from tkinter import filedialog
+    return filedialog.asksaveasfilename(defaultextension=".npz", filetypes=position_filetypes)
+
+def default_load_dialog():
+    from tkinter import filedialog
+    return filedialog.askopenfilename(defaultextension=".npz", filetypes=position_filetypes)
+
+def apply_delta(xy, seg, edge_src, edge_dst, idxs, dx, dy):
+    #Shift the selected nodes by (dx, dy), then re-gather the segment endpoints.
+    #Compiled in parallel by numba when it is installed (see below)
+    for k in prange(idxs.shape[0]):
+        i = idxs[k]
+        xy[i, 0] += dx
+        xy[i, 1] += dy
+    for e in prange(edge_src.shape[0]):
+        seg[e, 0, 0] = xy[edge_src[e], 0]
+        seg[e, 0, 1] = xy[edge_src[e], 1]
+        seg[e, 1, 0] = xy[edge_dst[e], 0]
+        seg[e, 1, 1] = xy[edge_dst[e], 1]
+
+if njit != None:
+    apply_delta = njit(parallel=True)(apply_delta)
+
+def left_button_in_axes(func):
+    #Shared event filter: only left-button events inside the axes reach the handler
+    def wrapper(self, event):
+        if event.inaxes == None:
+            return
+        if event.button != 1:
+            return
+        return func(self, event)
+    return wrapper
+
 class DraggableNetwork():
 
+    #No instance __dict__: attribute access in the per-frame callbacks resolves
+    #through fixed slots instead of a dictionary lookup
+    __slots__ = ('G', 'nodes', 'nodes0', 'node_size', 'edges', 'labels', 'weights',
+                 'node_size_radius', 'move_from', 'ax', 'canvas', 'artist_ls',
+                 'initial_key_ls', 'mark', 'axbtn1', 'axbtn2', 'btn1', 'btn2',
+                 'save_dialog', 'load_dialog',
+                 '_ind', '_pick_ind', '_dragged_artists', '_drag_label', '_drag_artist',
+                 '_background', '_pending', '_timer', '_dispatch_queue',
+                 '_radius2', '_max_radius', '_xy', '_xyt_cache', '_tree',
+                 '_cur_xlim', '_cur_ylim', '_node_list', '_node_index',
+                 '_artist_by_node', '_edge_src', '_edge_dst', '_seg',
+                 '_rowsA', '_rowsB', '_lc')
+
     epsilon = 30 #range size for selecting node
 
-    def __init__(self, G, nodes, edges, labels, nodes0=None, node_size=None, 
-                weights=None, node_size_radius=None, artist_ls=None, initial_key_ls=None):
-        
+    def __init__(self, G, nodes, edges, labels, nodes0=None, node_size=None,
+                weights=None, node_size_radius=None, artist_ls=None, initial_key_ls=None,
+                save_dialog=None, load_dialog=None):
+
         self.G = G
+        #File dialogs are pluggable so non-Tk GUIs can supply their own;
+        #None falls back to the tkinter dialogs, imported only when clicked
+        self.save_dialog = save_dialog
+        self.load_dialog = load_dialog
         self.nodes = nodes
         self.nodes0 = nodes0 
         self.node_size = node_size
@@ -62,8 +126,27 @@ class DraggableNetwork():
         self.labels = labels
         self.weights = weights
         self.node_size_radius=node_size_radius
+        if node_size_radius != None: #Precompute squared radii so picking never needs a sqrt
+            self._radius2 = np.asarray(node_size_radius, dtype=float)**2
+            self._max_radius = float(np.sqrt(self._radius2.max()))
+        else:
+            self._radius2 = None
+            self._max_radius = self.epsilon
+        #Single long-lived position buffer, the source of truth for node positions.
+        #The drag path mutates one row in place instead of allocating N x 2 per
+        #event; set_offsets copies on matplotlib >= 3.5, so every collection that
+        #shows the positions must be pushed the buffer explicitly after a change
+        self._xy = np.array(nodes.get_offsets(), dtype=float, copy=True)
+        nodes.set_offsets(self._xy)
+        if nodes0 != None:
+            nodes0.set_offsets(self._xy)
+        self.build_tree()
         self.move_from = 0
         self._ind = None
+        self._dragged_artists = []
+        self._drag_label = None  #label/image of the grabbed node, resolved once at press time
+        self._drag_artist = None
+        self._background = None
         self.ax = nodes.axes
         #Add external img
         self.artist_ls = artist_ls
@@ -77,7 +160,38 @@ class DraggableNetwork():
         self.axbtn2 = plt.axes([0.35, 0.025, 0.12, 0.05])
         self.btn1 = Button(ax=self.axbtn1, label='Save positions', color='powderblue', hovercolor='tomato')
         self.btn2 = Button(ax=self.axbtn2, label='Load positions', color='powderblue', hovercolor='tomato')
+        self.build_artist_index()
+        self.build_edge_collection()
         self.canvas = self.ax.figure.canvas
+        #Coalesce motion events: keep only the newest one and replay it at ~60 Hz,
+        #otherwise the node lags behind the cursor once the event queue backs up
+        self._pending = None
+        #GUI work handed over by the worker threads; drained by the same timer,
+        #which is the only place allowed to touch the toolkit
+        self._dispatch_queue = collections.deque()
+        self._timer = self.canvas.new_timer(interval=16)
+        self._timer.add_callback(self.flush_motion)
+        self._timer.start()
+        #Cache the display-space node coordinates between events; any pan/zoom
+        #(axis-limit change) or node move makes them stale
+        self._xyt_cache = None
+        self.ax.callbacks.connect('xlim_changed', self.invalidate_xyt)
+        self.ax.callbacks.connect('ylim_changed', self.invalidate_xyt)
+        #A figure resize or DPI change moves every pixel position without
+        #touching the axis limits, so it must invalidate the cache too
+        self.canvas.mpl_connect('resize_event', self.invalidate_xyt)
+        #Cache the axis limits too, so pan/zoom skip the get_xlim/get_ylim
+        #property walk on every event
+        self.refresh_limits()
+        self.ax.callbacks.connect('xlim_changed', self.refresh_limits)
+        self.ax.callbacks.connect('ylim_changed', self.refresh_limits)
+        #With a uniform pick radius, let matplotlib's compiled hit test find the
+        #clicked node; variable node_size_radius still needs the custom per-node test
+        self._pick_ind = None
+        if node_size == None:
+            nodes.set_picker(True)
+            nodes.set_pickradius(self.epsilon)
+            self.canvas.mpl_connect('pick_event', self.on_pick)
         #Connect the canvas to the mouse event and run the corresponding function if happend
         self.canvas.mpl_connect('button_press_event', self.button_press_callback)
         self.canvas.mpl_connect('button_release_event', self.button_release_callback)
@@ -86,102 +200,271 @@ class DraggableNetwork():
         self.button_factory(self.btn1, self.btn2)
 
         plt.show()
-        
 
-    def get_ind_under_point(self, event):   
-        xy = np.asarray(self.nodes.get_offsets()) #Obtain the positions of all nodes
-        xyt = self.ax.transData.transform(xy)
-        xt, yt = xyt[:, 0], xyt[:, 1]
 
-        d = np.sqrt((xt - event.x)**2 + (yt - event.y)**2)  #Calculate the distance between the click site and all nodes
-        ind = d.argmin()  #Select the nearest node, return its index
+    def build_artist_index(self):
+        #Key the incident edges and image of every node by its NetworkX id, so a
+        #drag touches O(deg) artists and never compares float position tuples.
+        #draw_networkx_nodes/edges keep the list(G.nodes())/list(G.edges()) order,
+        #so the offsets row of a node is its position in _node_list.
+        #Built once: the artists live for the whole session (Load updates them
+        #in place), so the index never goes stale.
+        self._node_list = list(self.G.nodes())
+        self._node_index = {node: i for i, node in enumerate(self._node_list)}
+        self._artist_by_node = {}
+        if self.artist_ls != None:
+            for key, artist in zip(self.initial_key_ls, self.artist_ls):
+                self._artist_by_node[key] = artist
+
+    def build_edge_collection(self):
+        #Replace the per-edge FancyArrowPatch artists with one LineCollection
+        #backed by an (E,2,2) segment array: a drag rewrites a few rows with
+        #fancy indexing and matplotlib draws a single artist at C level
+        self._edge_src = np.array([self._node_index[u] for u, v in self.G.edges()], dtype=int)
+        self._edge_dst = np.array([self._node_index[v] for u, v in self.G.edges()], dtype=int)
+        self._seg = np.empty((len(self._edge_src), 2, 2))
+        self._seg[:, 0, :] = self._xy[self._edge_src]
+        self._seg[:, 1, :] = self._xy[self._edge_dst]
+
+        rowsA = collections.defaultdict(list) #segment rows where a node is the start point
+        rowsB = collections.defaultdict(list) #segment rows where a node is the end point
+        for row in range(len(self._edge_src)):
+            rowsA[self._edge_src[row]].append(row)
+            rowsB[self._edge_dst[row]].append(row)
+        self._rowsA = {i: np.array(rows, dtype=int) for i, rows in rowsA.items()}
+        self._rowsB = {i: np.array(rows, dtype=int) for i, rows in rowsB.items()}
+
+        #The patches handed in by the caller are superseded; this runs once at
+        #construction, the collection is then reused for the whole session.
+        #Harvest their styling first so caller-chosen width/color/alpha survive
+        if self.edges != []:
+            linewidths = [edge.get_linewidth() for edge in self.edges]
+            colors = [edge.get_edgecolor() for edge in self.edges]
+        else:
+            linewidths = self.weights
+            colors = 'k'
+        for edge in self.edges:
+            edge.remove()
+        self._lc = LineCollection(self._seg, linewidths=linewidths, colors=colors, zorder=1)
+        self.ax.add_collection(self._lc)
+
+    def build_tree(self):
+        #KD-tree over the node data coordinates; stale only when positions change,
+        #so it's rebuilt on drag release and on Load rather than per event
+        if cKDTree != None:
+            self._tree = cKDTree(self._xy)
+        else:
+            self._tree = None
+
+    def invalidate_xyt(self, *args): #called with an Axes, a ResizeEvent or nothing
+        self._xyt_cache = None
+
+    def refresh_limits(self, ax=None):
+        self._cur_xlim = np.array(self.ax.get_xlim())
+        self._cur_ylim = np.array(self.ax.get_ylim())
+
+    def get_ind_under_point(self, event):
+        if self._tree != None:
+            #Transform only the click site to data coordinates and query the tree,
+            #instead of transforming every node to display coordinates
+            inv = self.ax.transData.inverted()
+            ex, ey = inv.transform((event.x, event.y))
+            ex1, ey1 = inv.transform((event.x + 1.0, event.y + 1.0))
+            scale = max(abs(ex1 - ex), abs(ey1 - ey)) #data units per pixel
+            candidates = self._tree.query_ball_point((ex, ey), r=self._max_radius*scale)
+            if candidates == []:
+                return None
+            xyt = self.ax.transData.transform(self._xy[candidates])
+            dx = xyt[:, 0] - event.x
+            dy = xyt[:, 1] - event.y
+            d2 = dx*dx + dy*dy
+            nearest = int(d2.argmin())
+            ind = candidates[nearest]
+            if self.node_size == None:
+                if d2[nearest] >= self.epsilon**2:
+                    ind = None
+            else:
+                if d2[nearest] >= self._radius2[ind]:
+                    ind = None
+            return ind
+
+        if self._xyt_cache is None: #Reuse the display-space coords between picks
+            self._xyt_cache = self.ax.transData.transform(self._xy)
+        xyt = self._xyt_cache
+
+        dx = xyt[:, 0] - event.x
+        dy = xyt[:, 1] - event.y
+        d2 = dx*dx + dy*dy  #Squared distance between the click site and all nodes (same argmin, no sqrt)
+        ind = int(d2.argmin())  #Select the nearest node, return its index
 
         if self.node_size == None:
-            if d[ind] >= self.epsilon:  #If the distance is larger than the set bound
+            if d2[ind] >= self.epsilon**2:  #If the distance is larger than the set bound
                 ind = None
         else:
-            if d[ind] >= self.node_size_radius[ind]:
+            if d2[ind] >= self._radius2[ind]:
                 ind = None
 
         return ind
 
+    def on_pick(self, event):
+        #Figure.pick runs before our button_press_callback (it was connected at
+        #figure creation), so the hit is ready when the press handler fires
+        if event.artist is self.nodes and event.mouseevent.button == 1:
+            self._pick_ind = int(event.ind[0])
+
+    @left_button_in_axes
     def button_press_callback(self, event):
-        if event.inaxes is None:
-            return
-        if event.button != 1:
-            return
+        pick_ind = self._pick_ind #consume the hit before any early return, so a
+        self._pick_ind = None     #press we reject can never leak it to a later click
         if event.x < 130 or event.y < 111: #If outside the figure
             return
-        self._ind = self.get_ind_under_point(event)
+        if self.node_size == None:
+            self._ind = pick_ind #from matplotlib's own hit test, this press only
+        else:
+            self._ind = self.get_ind_under_point(event)
         if self._ind == None:
             self.move_from = (event.x, event.y)
+        else:
+            self.start_blit()
+
+    def start_blit(self):
+        #Collect the artists moving with the selected node, then snapshot everything else once
+        node = self._node_list[self._ind]
+
+        self._dragged_artists = [self.nodes]
+        if self.nodes0 != None:
+            self._dragged_artists.append(self.nodes0)
+        self._dragged_artists.append(self._lc)
+        self._drag_label = self.labels.get(node)
+        if self._drag_label != None:
+            self._dragged_artists.append(self._drag_label)
+        self._drag_artist = self._artist_by_node.get(node)
+        if self._drag_artist != None:
+            self._dragged_artists.append(self._drag_artist)
+
+        for artist in self._dragged_artists:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
 
     def button_release_callback(self, event):
+        #Not decorated: a release outside the axes must still end the drag
         if event.button != 1:
             return
+        if self._dragged_artists != []:
+            for artist in self._dragged_artists:
+                artist.set_animated(False)
+            self._dragged_artists = []
+            self._background = None
+            self.canvas.draw_idle()
+            self.build_tree() #Node positions changed during the drag
+            self.invalidate_xyt()
+        self._drag_label = None
+        self._drag_artist = None
         self._ind = None
+        self._pick_ind = None
         self.move_from = 0
+        self._pending = None
 
+    @left_button_in_axes
     def motion_notify_callback(self, event):
         if self._ind == None and self.move_from == 0:
             return
-        if event.inaxes == None:
-            return
-        if event.button != 1:
+        self._pending = (event.x, event.y, event.xdata, event.ydata) #flush_motion picks it up
+
+    def flush_motion(self):
+        while self._dispatch_queue: #Run GUI work queued by the worker threads
+            func = self._dispatch_queue.popleft()
+            func()
+        if self._pending == None:
             return
+        event_x, event_y, xdata_event, ydata_event = self._pending
+        self._pending = None
         if self.move_from != 0:
-            cur_xlim = self.ax.get_xlim()
-            cur_ylim = self.ax.get_ylim()
+            cur_xlim = self._cur_xlim #cached; the lim-changed callbacks keep them fresh
+            cur_ylim = self._cur_ylim
             cur_xrange = (cur_xlim[1] - cur_xlim[0])
             cur_yrange = (cur_ylim[1] - cur_ylim[0])
             xy_factor = cur_xrange/cur_yrange
-            xdata = (event.x - self.move_from[0])/300*cur_xrange # get event x location
-            ydata = (event.y - self.move_from[1])/300/xy_factor*cur_xrange # get event y location
+            xdata = (event_x - self.move_from[0])/300*cur_xrange # get event x location
+            ydata = (event_y - self.move_from[1])/300/xy_factor*cur_xrange # get event y location
        
             self.ax.set_xlim([cur_xlim[0]-xdata,
                         cur_xlim[1]-xdata])
             self.ax.set_ylim([cur_ylim[0]-ydata,
                         cur_ylim[1]-ydata])
 
-            self.move_from = (event.x, event.y)
-            plt.draw() # force re-draw
+            self.move_from = (event_x, event_y)
+            self.canvas.draw_idle() # coalesced re-draw on the next idle tick
 
         elif self._ind != None:
-            x, y = event.xdata, event.ydata
-            xy = np.asarray(self.nodes.get_offsets())
-
-            target_pos = tuple(xy[self._ind])  #Save the selected original node position
-            xy[self._ind] = np.array([x, y])   #Update node position
-
-            for edge in self.edges:            #Update edge position if it's connected to the selected node 
-                posA, posB = edge._posA_posB 
-                if posA == target_pos or posB == target_pos:
-                    if posA == target_pos:
-                        edge.set_positions((x, y), posB)
-                    else:
-                        edge.set_positions(posA, (x, y))
-            for label in self.labels.values(): #Update label position  
-                position = label.get_position()
-                if position == target_pos:
-                    label.set_position((x, y))
+            x, y = xdata_event, ydata_event
+            ind = self._ind #bind the hot attributes to locals (LOAD_FAST)
+            xy = self._xy
+            seg = self._seg
+
+            xy[ind, 0] = x                     #Update node position in the shared buffer
+            xy[ind, 1] = y
+
+            rowsA = self._rowsA.get(ind)       #Rewrite only the segment rows touching the node
+            if rowsA is not None:
+                seg[rowsA, 0, :] = (x, y)
+            rowsB = self._rowsB.get(ind)
+            if rowsB is not None:
+                seg[rowsB, 1, :] = (x, y)
+            self._lc.set_segments(seg)
+            if self._drag_label != None:       #Update label position (resolved at press time)
+                self._drag_label.set_position((x, y))
 
             self.nodes.set_offsets(xy)
-            if self.nodes0 != None:
+            if self.nodes0 != None: #set_offsets copies, so the underlay needs its own push
                 self.nodes0.set_offsets(xy)
 
-            #Update external images
-            if self.artist_ls != None:
-                for artist in self.artist_ls:
-                    if artist.xybox == target_pos:
-                        artist.xybox = (x, y)
+            #Update external image (resolved at press time)
+            if self._drag_artist != None:
+                self._drag_artist.xybox = (x, y)
 
-            self.canvas.draw_idle()
+            if self._background != None:
+                #Restore the static snapshot and redraw only the moved artists
+                self.canvas.restore_region(self._background)
+                for artist in self._dragged_artists:
+                    self.ax.draw_artist(artist)
+                self.canvas.blit(self.ax.bbox)
+            else:
+                self.canvas.draw_idle()
+
+    def move_nodes(self, idxs, dx, dy):
+        #Batched update for moving several nodes at once (rubber-band selection):
+        #one compiled or vectorized call instead of a Python loop per node
+        idxs = np.asarray(idxs, dtype=int)
+        if njit != None:
+            apply_delta(self._xy, self._seg, self._edge_src, self._edge_dst, idxs, dx, dy)
+        else:
+            #NumPy fallback: same result through fancy indexing
+            self._xy[idxs, 0] += dx
+            self._xy[idxs, 1] += dy
+            self._seg[:, 0, :] = self._xy[self._edge_src]
+            self._seg[:, 1, :] = self._xy[self._edge_dst]
+        self._lc.set_segments(self._seg)
+        self.nodes.set_offsets(self._xy)
+        for k in idxs:                #Labels and images follow their nodes
+            node = self._node_list[k]
+            pos = (self._xy[k, 0], self._xy[k, 1])
+            label = self.labels.get(node)
+            if label != None:
+                label.set_position(pos)
+            artist = self._artist_by_node.get(node)
+            if artist != None:
+                artist.xybox = pos
+        self.build_tree() #Node positions changed
+        self.invalidate_xyt()
+        self.canvas.draw_idle()
 
     def zoom_factory(self, ax, base_scale):
         def zoom_fun(event):
-            # get the current x and y limits
-            cur_xlim = ax.get_xlim()
-            cur_ylim = ax.get_ylim()
+            # the current x and y limits, cached by the lim-changed callbacks
+            cur_xlim = self._cur_xlim
+            cur_ylim = self._cur_ylim
             cur_xrange = (cur_xlim[1] - cur_xlim[0])*.5
             cur_yrange = (cur_ylim[1] - cur_ylim[0])*.5
             xdata = event.xdata # get event x location
@@ -201,7 +484,7 @@ class DraggableNetwork():
                         cur_xlim[1] + cur_xrange*scale_factor])
             ax.set_ylim([cur_ylim[0] - cur_yrange*scale_factor,
                         cur_ylim[1] + cur_yrange*scale_factor])
-            plt.draw() # force re-draw
+            self.canvas.draw_idle() # coalesced re-draw on the next idle tick
 
         # attach the call back 
         self.canvas.mpl_connect('scroll_event', zoom_fun)
@@ -209,59 +492,106 @@ class DraggableNetwork():
         #return the function
         return zoom_fun
     
+    def run_on_main_thread(self, func):
+        #GUI drawing is not thread-safe and a toolkit timer created on a worker
+        #thread never fires on Qt, so workers only append their GUI work here;
+        #the 16 ms timer on the main loop drains the queue on its next tick.
+        #deque.append is atomic, and a queue means overlapping save and load
+        #completions cannot overwrite each other
+        self._dispatch_queue.append(func)
+
+    def apply_loaded_positions(self, initial_position):
+        #Runs on the main thread once the worker has parsed the file.
+        #The graph topology is unchanged on load, so instead of clearing the
+        #axes and rebuilding every artist we write the new positions into the
+        #existing buffer and let the artists pick them up in place. Reusing the
+        #artists also keeps the picker subscription, the node/edge index maps
+        #and the blit machinery valid without any re-registration
+        if initial_position != None:
+            for node, label in self.labels.items():
+                key = label.get_text() #saved files are keyed by the label text
+                if key in initial_position:
+                    self._xy[self._node_index[node]] = initial_position[key]
+                label.set_position(tuple(self._xy[self._node_index[node]]))
+            self.nodes.set_offsets(self._xy)
+            if self.nodes0 != None:
+                self.nodes0.set_offsets(self._xy)
+            #Gather the segment endpoints back from the updated buffer
+            self._seg[:, 0, :] = self._xy[self._edge_src]
+            self._seg[:, 1, :] = self._xy[self._edge_dst]
+            self._lc.set_segments(self._seg)
+            #Update img
+            if self.artist_ls != None:
+                for i in range(len(self.artist_ls)):
+                    key = self.initial_key_ls[i]
+                    if key in initial_position:
+                        self.artist_ls[i].xybox = initial_position[key]
+            self.build_tree() #Node positions changed
+            self.invalidate_xyt()
+
+        self.btn2.label.set_text('Load positions')
+        self.canvas.draw_idle()
+
+    def finish_save(self):
+        self.btn1.label.set_text('Save positions')
+        self.canvas.draw_idle()
+
     def button_factory(self, btn1, btn2):
         def saving_thread():
-            time.sleep(0.001) #timedelay for the button to show 'Saving' 
-            f = filedialog.asksaveasfile(mode='w', defaultextension=".txt")
-            if f!=None:
-                string = '' 
-                for i in self.labels.values():
-                    key = i.get_text()
-                    x, y = i.get_position()
-                    string += key+':'+str(x)+','+str(y)+'\n'
-                f.write(string)
-                f.close()
-            self.btn1.label.set_text('Save positions')
-            plt.draw()
+            #Only the blocking dialog and file I/O stay on the worker
+            if self.save_dialog != None:
+                filename = self.save_dialog()
+            else:
+                filename = default_save_dialog()
+            if filename != '' and filename != ():
+                if filename.endswith('.npz'):
+                    #Binary dump: linear in N and about half the size of the text format
+                    keys = np.array([label.get_text() for label in self.labels.values()])
+                    xy = np.array([label.get_position() for label in self.labels.values()], dtype=np.float64)
+                    np.savez(filename, keys=keys, xy=xy)
+                else:
+                    lines = []
+                    for i in self.labels.values():
+                        key = i.get_text()
+                        x, y = i.get_position()
+                        lines.append(key+':'+str(x)+','+str(y)+'\n')
+                    with open(filename, 'w') as f:
+                        f.write(''.join(lines))
+            self.run_on_main_thread(self.finish_save)
 
         def load_thread():
-            time.sleep(0.001) #timedelay for the button to show 'loading...' 
-            f = filedialog.askopenfile(mode='r', defaultextension=".txt")
-            if f!=None:
-                initial_position = {}
-                lines = f.readlines()
-                for line in lines:
-                    node, xy = line.strip().split(':')
-                    x, y = xy.split(',')
-                    initial_position[node] = (float(x), float(y))
-                f.close()
-                self.ax.cla()
-             
-                self.labels = nx.draw_networkx_labels(self.G, pos=initial_position, ax=self.ax, font_size=8, font_color='k', font_family='sans-serif', font_weight='normal')
-                self.edges = nx.draw_networkx_edges(self.G, pos=initial_position, ax=self.ax, width=self.weights) #, arrowstyle='->',connectionstyle='arc3, rad=0.3'
-                if self.nodes0 != None:
-                    self.nodes0 = nx.draw_networkx_nodes(self.G, pos=initial_position, ax=self.ax, node_size=self.node_size, node_color='w', node_shape='o', alpha=1)
-                self.nodes = nx.draw_networkx_nodes(self.G, pos=initial_position, ax=self.ax, node_size=self.node_size, node_color='b', node_shape='o', alpha=0.3)
-                #Update img
-                if self.artist_ls != None:
-                    for i in range(len(self.artist_ls)):
-                        self.artist_ls[i].xybox = initial_position[self.initial_key_ls[i]]
-                        self.ax.add_artist(self.artist_ls[i])
-
-            self.btn2.label.set_text('Load positions')
-            plt.draw()
-
-        def save_pos_button(event): 
-            t1 = threading.Thread(name='save pos',target=saving_thread) 
-            t1.start() 
+            #Only the blocking dialog, file I/O and parsing stay on the worker;
+            #the artist updates are dispatched back to the main thread
+            if self.load_dialog != None:
+                filename = self.load_dialog()
+            else:
+                filename = default_load_dialog()
+            initial_position = None
+            if filename != '' and filename != ():
+                if filename.endswith('.npz'):
+                    d = np.load(filename)
+                    initial_position = dict(zip(d['keys'].tolist(), map(tuple, d['xy'])))
+                else:
+                    #Text files written by older versions stay loadable
+                    initial_position = {}
+                    with open(filename, 'r') as f:
+                        for line in f:
+                            node, xy = line.strip().split(':')
+                            x, y = xy.split(',')
+                            initial_position[node] = (float(x), float(y))
+            self.run_on_main_thread(lambda: self.apply_loaded_positions(initial_position))
+
+        def save_pos_button(event):
+            t1 = threading.Thread(name='save pos',target=saving_thread)
+            t1.start()
             self.btn1.label.set_text('Saving...')
-            plt.draw()
+            self.canvas.draw_idle()
 
-        def load_pos_button(event): 
-            t2 = threading.Thread(name='load pos',target=load_thread) 
-            t2.start() 
+        def load_pos_button(event):
+            t2 = threading.Thread(name='load pos',target=load_thread)
+            t2.start()
             self.btn2.label.set_text('Loading...')
-            plt.draw()        
+            self.canvas.draw_idle()
         btn1.on_clicked(save_pos_button)
         btn2.on_clicked(load_pos_button)
     